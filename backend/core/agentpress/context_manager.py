@@ -5,6 +5,8 @@ This module handles token counting and thread summarization to prevent
 reaching the context window limitations of LLM models.
 """
 
+import asyncio
+import functools
 import json
 import os
 from typing import List, Dict, Any, Optional, Union
@@ -18,34 +20,26 @@ from core.agentpress.prompt_caching import apply_anthropic_caching_strategy
 
 DEFAULT_TOKEN_THRESHOLD = 120000
 
+
 # Module-level singleton clients for memory efficiency
 # These are lazily initialized once and reused across all ContextManager instances
-_anthropic_client = None
-_bedrock_client = None
-_clients_initialized = False
-
-
+@functools.cache
 def _get_anthropic_client_singleton():
     """Module-level lazy initialization of Anthropic client (singleton)."""
-    global _anthropic_client, _clients_initialized
-    if _anthropic_client is None and not _clients_initialized:
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if api_key:
-            _anthropic_client = Anthropic(api_key=api_key)
-        _clients_initialized = True
-    return _anthropic_client
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if api_key:
+        return Anthropic(api_key=api_key)
+    return None
 
 
 def _get_bedrock_client_singleton():
-    """Module-level lazy initialization of Bedrock client (singleton)."""
-    global _bedrock_client
-    if _bedrock_client is None:
-        try:
-            import boto3
-            _bedrock_client = boto3.client('bedrock-runtime', region_name='us-west-2')
-        except Exception as e:
-            logger.debug(f"Could not initialize Bedrock client: {e}")
-    return _bedrock_client
+    """Get the shared Bedrock runtime client."""
+    try:
+        from core.services.aws_clients import get_client
+        return get_client('bedrock-runtime', region_name='us-west-2')
+    except Exception as e:
+        logger.debug(f"Could not initialize Bedrock client: {e}")
+        return None
 
 
 class ContextManager:
@@ -144,7 +138,7 @@ class ContextManager:
                     if system_content:
                         count_params['system'] = system_content
                     
-                    result = client.messages.count_tokens(**count_params)
+                    result = await asyncio.to_thread(client.messages.count_tokens, **count_params)
                     return result.input_tokens
             except Exception as e:
                 logger.debug(f"Anthropic token counting failed, falling back to LiteLLM: {e}")
@@ -213,7 +207,8 @@ class ContextManager:
                         input_to_count['system'] = clean_content_for_bedrock(system_to_count.get('content'))
                     
                     # Call Bedrock count_tokens API
-                    response = bedrock_client.count_tokens(
+                    response = await asyncio.to_thread(
+                        bedrock_client.count_tokens,
                         modelId=bedrock_model_id,
                         input={'converse': input_to_count}
                     )
@@ -46,6 +46,15 @@ from core.agentpress.xml_tool_parser import strip_xml_tool_calls
 # Type alias for tool execution strategy
 ToolExecutionStrategy = Literal["sequential", "parallel"]
 
+
+def _join_delta_parts(parts: list) -> str:
+    """Join list-form delta content, skipping str() when every part is already a string."""
+    try:
+        return ''.join(parts)
+    except TypeError:
+        return ''.join(str(item) for item in parts)
+
+
 @dataclass
 class ToolExecutionContext:
     """Context for a tool execution including call details, result, and display info."""
@@ -421,7 +430,7 @@ class ResponseProcessor:
                         reasoning_content = delta.reasoning_content
                         # logger.debug(f"Processing reasoning_content: type={type(reasoning_content)}, value={reasoning_content}")
                         if isinstance(reasoning_content, list):
-                            reasoning_content = ''.join(str(item) for item in reasoning_content)
+                            reasoning_content = _join_delta_parts(reasoning_content)
                         # logger.debug(f"About to concatenate reasoning_content (type={type(reasoning_content)}) to accumulated_content (type={type(accumulated_content)})")
                         accumulated_content += reasoning_content
 
@@ -430,7 +439,7 @@ class ResponseProcessor:
                         chunk_content = delta.content
                         # logger.debug(f"Processing chunk_content: type={type(chunk_content)}, value={chunk_content}")
                         if isinstance(chunk_content, list):
-                            chunk_content = ''.join(str(item) for item in chunk_content)
+                            chunk_content = _join_delta_parts(chunk_content)
                         # print(chunk_content, end='', flush=True)
                         # logger.debug(f"About to concatenate chunk_content (type={type(chunk_content)}) to accumulated_content (type={type(accumulated_content)})")
                         accumulated_content += chunk_content
@@ -80,7 +80,7 @@ async def get_tier_configurations() -> Dict:
                 'monthly_credits': float(tier.monthly_credits),
                 'can_purchase_credits': tier.can_purchase_credits,
                 'project_limit': tier.project_limit,
-                'price_ids': tier.price_ids,
+                'price_ids': list(tier.price_ids),
             }
             tier_configs.append(tier_config)
         
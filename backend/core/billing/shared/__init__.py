@@ -5,9 +5,11 @@ from .config import (
     FREE_TIER_INITIAL_CREDITS,
     Tier,
     TIERS,
+    CreditPackage,
     CREDIT_PACKAGES,
     ADMIN_LIMITS,
     get_tier_by_price_id,
+    get_package_by_price_id,
     get_tier_by_name,
     get_monthly_credits,
     can_purchase_credits,
@@ -50,9 +52,11 @@ __all__ = [
     'FREE_TIER_INITIAL_CREDITS',
     'Tier',
     'TIERS',
+    'CreditPackage',
     'CREDIT_PACKAGES',
     'ADMIN_LIMITS',
     'get_tier_by_price_id',
+    'get_package_by_price_id',
     'get_tier_by_name',
     'get_monthly_credits',
     'can_purchase_credits',
@@ -1,6 +1,7 @@
 from decimal import Decimal
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
 
 from click.decorators import R
 from core.utils.config import config
@@ -18,31 +19,35 @@ CREDITS_PER_DOLLAR = 100
 
 FREE_TIER_INITIAL_CREDITS = Decimal('0.00')
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Tier:
     name: str
-    price_ids: List[str]
+    price_ids: Tuple[str, ...]
     monthly_credits: Decimal
     display_name: str
     can_purchase_credits: bool
-    models: List[str]
+    models: FrozenSet[str]
     project_limit: int
     thread_limit: int
     concurrent_runs: int
     custom_workers_limit: int
     scheduled_triggers_limit: int
     app_triggers_limit: int
-    daily_credit_config: Optional[Dict] = None
+    daily_credit_config: Optional[Dict] = field(default=None, hash=False)
     monthly_refill_enabled: Optional[bool] = True
+    allow_all: bool = field(init=False, default=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'allow_all', 'all' in self.models)
 
 TIERS: Dict[str, Tier] = {
     'none': Tier(
         name='none',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('0.00'),
         display_name='No Plan',
         can_purchase_credits=False,
-        models=['haiku'],
+        models=frozenset({'haiku'}),
         project_limit=0,
         thread_limit=0,
         concurrent_runs=0,
@@ -52,11 +57,11 @@ TIERS: Dict[str, Tier] = {
     ),
     'free': Tier(
         name='free',
-        price_ids=[config.STRIPE_FREE_TIER_ID],
+        price_ids=(config.STRIPE_FREE_TIER_ID,),
         monthly_credits=Decimal('0.00'),
         display_name='Basic',
         can_purchase_credits=False,
-        models=['haiku'],
+        models=frozenset({'haiku'}),
         project_limit=3,
         thread_limit=10,
         concurrent_runs=1,
@@ -72,15 +77,15 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_2_20': Tier(
         name='tier_2_20',
-        price_ids=[
+        price_ids=(
             config.STRIPE_TIER_2_20_ID,
             config.STRIPE_TIER_2_20_YEARLY_ID,
-            config.STRIPE_TIER_2_17_YEARLY_COMMITMENT_ID
-        ],
+            config.STRIPE_TIER_2_17_YEARLY_COMMITMENT_ID,
+        ),
         monthly_credits=Decimal('40.00'),
         display_name='Plus',
         can_purchase_credits=False,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=100,
         thread_limit=100,
         concurrent_runs=3,
@@ -96,15 +101,15 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_6_50': Tier(
         name='tier_6_50',
-        price_ids=[
+        price_ids=(
             config.STRIPE_TIER_6_50_ID,
             config.STRIPE_TIER_6_50_YEARLY_ID,
-            config.STRIPE_TIER_6_42_YEARLY_COMMITMENT_ID
-        ],
+            config.STRIPE_TIER_6_42_YEARLY_COMMITMENT_ID,
+        ),
         monthly_credits=Decimal('100.00'),
         display_name='Pro',
         can_purchase_credits=False,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=500,
         thread_limit=500,
         concurrent_runs=5,
@@ -120,15 +125,15 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_25_200': Tier(
         name='tier_25_200',
-        price_ids=[
+        price_ids=(
             config.STRIPE_TIER_25_200_ID,
             config.STRIPE_TIER_25_200_YEARLY_ID,
-            config.STRIPE_TIER_25_170_YEARLY_COMMITMENT_ID
-        ],
+            config.STRIPE_TIER_25_170_YEARLY_COMMITMENT_ID,
+        ),
         monthly_credits=Decimal('400.00'),
         display_name='Ultra',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=2500,
         thread_limit=2500,
         concurrent_runs=20,
@@ -146,11 +151,11 @@ TIERS: Dict[str, Tier] = {
     # Legacy tiers - users may still be on these from previous pricing
     'tier_12_100': Tier(
         name='tier_12_100',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('100.00'),
         display_name='Legacy Pro',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=1000,
         thread_limit=1000,
         concurrent_runs=10,
@@ -166,11 +171,11 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_50_400': Tier(
         name='tier_50_400',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('400.00'),
         display_name='Legacy Business',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=5000,
         thread_limit=5000,
         concurrent_runs=30,
@@ -186,11 +191,11 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_125_800': Tier(
         name='tier_125_800',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('800.00'),
         display_name='Legacy Enterprise',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=10000,
         thread_limit=10000,
         concurrent_runs=50,
@@ -206,11 +211,11 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_200_1000': Tier(
         name='tier_200_1000',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('1000.00'),
         display_name='Legacy Enterprise Plus',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=25000,
         thread_limit=25000,
         concurrent_runs=100,
@@ -226,11 +231,11 @@ TIERS: Dict[str, Tier] = {
     ),
     'tier_150_1200': Tier(
         name='tier_150_1200',
-        price_ids=[],
+        price_ids=(),
         monthly_credits=Decimal('1200.00'),
         display_name='Legacy Enterprise Max',
         can_purchase_credits=True,
-        models=['all'],
+        models=frozenset({'all'}),
         project_limit=25000,
         thread_limit=25000,
         concurrent_runs=100,
@@ -246,14 +251,30 @@ TIERS: Dict[str, Tier] = {
     ),
 }
 
-CREDIT_PACKAGES = [
-    {'amount': Decimal('10.00'), 'stripe_price_id': config.STRIPE_CREDITS_10_PRICE_ID},
-    {'amount': Decimal('25.00'), 'stripe_price_id': config.STRIPE_CREDITS_25_PRICE_ID},
-    {'amount': Decimal('50.00'), 'stripe_price_id': config.STRIPE_CREDITS_50_PRICE_ID},
-    {'amount': Decimal('100.00'), 'stripe_price_id': config.STRIPE_CREDITS_100_PRICE_ID},
-    {'amount': Decimal('250.00'), 'stripe_price_id': config.STRIPE_CREDITS_250_PRICE_ID},
-    {'amount': Decimal('500.00'), 'stripe_price_id': config.STRIPE_CREDITS_500_PRICE_ID},
-]
+class CreditPackage(NamedTuple):
+    amount: Decimal
+    stripe_price_id: Optional[str]
+
+CREDIT_PACKAGES: Tuple[CreditPackage, ...] = (
+    CreditPackage(Decimal('10.00'), config.STRIPE_CREDITS_10_PRICE_ID),
+    CreditPackage(Decimal('25.00'), config.STRIPE_CREDITS_25_PRICE_ID),
+    CreditPackage(Decimal('50.00'), config.STRIPE_CREDITS_50_PRICE_ID),
+    CreditPackage(Decimal('100.00'), config.STRIPE_CREDITS_100_PRICE_ID),
+    CreditPackage(Decimal('250.00'), config.STRIPE_CREDITS_250_PRICE_ID),
+    CreditPackage(Decimal('500.00'), config.STRIPE_CREDITS_500_PRICE_ID),
+)
+
+_PACKAGE_BY_PRICE_ID: Dict[str, CreditPackage] = {
+    package.stripe_price_id: package for package in CREDIT_PACKAGES if package.stripe_price_id
+}
+
+# Reversed so the first tier declaring a price id wins
+_PRICE_ID_TO_TIER: Dict[str, Tier] = {
+    price_id: tier
+    for tier in reversed(list(TIERS.values()))
+    for price_id in tier.price_ids
+    if price_id
+}
 
 ADMIN_LIMITS = {
     'max_credit_adjustment': Decimal('1000.00'),
@@ -262,27 +283,33 @@ ADMIN_LIMITS = {
 }
 
 def get_tier_by_price_id(price_id: str) -> Optional[Tier]:
-    for tier in TIERS.values():
-        if price_id in tier.price_ids:
-            return tier
-    return None
+    if not price_id:
+        return None
+    return _PRICE_ID_TO_TIER.get(price_id)
+
+def get_package_by_price_id(price_id: str) -> Optional[CreditPackage]:
+    if not price_id:
+        return None
+    return _PACKAGE_BY_PRICE_ID.get(price_id)
 
 def get_tier_by_name(tier_name: str) -> Optional[Tier]:
     return TIERS.get(tier_name)
 
+@lru_cache(maxsize=32)
 def get_monthly_credits(tier_name: str) -> Decimal:
     tier = TIERS.get(tier_name)
     return tier.monthly_credits if tier else TIERS['none'].monthly_credits
 
+@lru_cache(maxsize=32)
 def can_purchase_credits(tier_name: str) -> bool:
     tier = TIERS.get(tier_name)
     return tier.can_purchase_credits if tier else False
 
 def is_model_allowed(tier_name: str, model: str) -> bool:
-    tier = TIERS.get(tier_name, TIERS['none'])
+    tier = TIERS.get(tier_name) or TIERS['none']
     
     # Tier has access to all models
-    if 'all' in tier.models:
+    if tier.allow_all:
         return True
     
     from core.ai_models import model_manager
@@ -314,6 +341,7 @@ def is_model_allowed(tier_name: str, model: str) -> bool:
     
     return False
 
+@lru_cache(maxsize=32)
 def get_project_limit(tier_name: str) -> int:
     tier = TIERS.get(tier_name)
     return tier.project_limit if tier else 3
@@ -381,5 +409,5 @@ def get_tier_limits(tier_name: str) -> Dict:
         'app_triggers_limit': tier.app_triggers_limit,
         'agent_limit': tier.custom_workers_limit,
         'can_purchase_credits': tier.can_purchase_credits,
-        'models': tier.models
+        'models': sorted(tier.models)
     }
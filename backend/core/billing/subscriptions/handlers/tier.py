@@ -39,7 +39,7 @@ class TierHandler:
             'display_name': tier_obj.display_name,
             'credits': float(tier_obj.monthly_credits),
             'can_purchase_credits': tier_obj.can_purchase_credits,
-            'models': tier_obj.models,
+            'models': sorted(tier_obj.models),
             'project_limit': tier_obj.project_limit,
             'thread_limit': tier_obj.thread_limit,
             'concurrent_runs': tier_obj.concurrent_runs,
@@ -1,5 +1,6 @@
 import re
 import unicodedata
+from uuid import uuid4
 from typing import Tuple, Optional
 from fastapi import HTTPException
 
@@ -97,8 +98,10 @@ class FileNameValidator:
         # First, sanitize the base name
         base_name = cls.sanitize_name(base_name)
         
+        existing_lower = {name.lower() for name in existing_names}
+        
         # Check if base name is already unique
-        if base_name.lower() not in [name.lower() for name in existing_names]:
+        if base_name.lower() not in existing_lower:
             return base_name
         
         # Split name and extension for files
@@ -113,14 +116,13 @@ class FileNameValidator:
         counter = 2
         while True:
             new_name = f"{name_part} {counter}{ext}"
-            if new_name.lower() not in [name.lower() for name in existing_names]:
+            if new_name.lower() not in existing_lower:
                 return new_name
             counter += 1
             
             # Safety break (shouldn't happen in normal use)
             if counter > 1000:
-                import uuid
-                unique_id = str(uuid.uuid4())[:8]
+                unique_id = uuid4().hex[:8]
                 return f"{name_part}_{unique_id}{ext}"
 
 class ValidationError(HTTPException):
@@ -0,0 +1,59 @@
+"""
+Shared boto3 clients.
+
+Creating a boto3 client loads the service model and builds the endpoint
+resolver, so clients are created lazily once per (service, region, endpoint)
+and reused across the process. boto3 clients are thread-safe once built;
+sessions are not, so construction is serialized behind a lock.
+
+Clients keep TCP connections alive and use a larger connection pool than
+botocore's default of 10 so concurrent calls don't queue or re-handshake.
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+_session = None
+_clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+_lock = threading.Lock()
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        import boto3
+        _session = boto3.session.Session()
+    return _session
+
+
+def _build_client_config():
+    from botocore.config import Config
+    from core.utils.config import config
+
+    return Config(
+        tcp_keepalive=config.AWS_HTTP_TCP_KEEPALIVE,
+        max_pool_connections=config.AWS_HTTP_MAX_POOL_CONNECTIONS,
+    )
+
+
+def get_client(service_name: str, region_name: str = 'us-west-2', endpoint_url: Optional[str] = None) -> Any:
+    """Get or create the shared boto3 client for a service.
+
+    Raises whatever boto3 raises if the client cannot be built; failures are
+    not cached so the next call retries.
+    """
+    key = (service_name, region_name, endpoint_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _get_session().client(
+                service_name,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=_build_client_config(),
+            )
+            _clients[key] = client
+    return client
@@ -13,26 +13,17 @@ from typing import Optional
 from core.utils.logger import logger
 from core.utils.config import config, EnvMode
 
-# CloudWatch client (lazy initialized)
-_cloudwatch_client = None
-
-
 def _get_cloudwatch_client():
-    """Get or create CloudWatch client (production only)."""
-    global _cloudwatch_client
-    
+    """Get the shared CloudWatch client (production only)."""
     if config.ENV_MODE != EnvMode.PRODUCTION:
         return None
         
-    if _cloudwatch_client is None:
-        try:
-            import boto3
-            _cloudwatch_client = boto3.client('cloudwatch', region_name='us-west-2')
-        except Exception as e:
-            logger.warning(f"Failed to initialize CloudWatch client: {e}")
-            return None
-    
-    return _cloudwatch_client
+    try:
+        from core.services.aws_clients import get_client
+        return get_client('cloudwatch', region_name='us-west-2')
+    except Exception as e:
+        logger.warning(f"Failed to initialize CloudWatch client: {e}")
+        return None
 
 
 async def get_queue_metrics() -> dict:
@@ -76,7 +67,8 @@ async def publish_to_cloudwatch(queue_depth: int) -> bool:
         return False
     
     try:
-        cloudwatch.put_metric_data(
+        await asyncio.to_thread(
+            cloudwatch.put_metric_data,
             Namespace='Kortix',
             MetricData=[{
                 'MetricName': 'DramatiqQueueDepth',
@@ -2,12 +2,13 @@ from core.agentpress.tool import ToolResult, openapi_schema, tool_metadata
 from core.agentpress.thread_manager import ThreadManager
 from core.sandbox.tool_base import SandboxToolsBase
 from core.utils.logger import logger
-from core.utils.s3_upload_utils import upload_base64_image
+from core.utils.s3_upload_utils import upload_image_bytes
 import asyncio
 import json
 import base64
 import io
 import traceback
+from typing import Optional
 from PIL import Image
 from core.utils.config import config
 
@@ -38,53 +39,50 @@ class BrowserTool(SandboxToolsBase):
         super().__init__(project_id, thread_manager)
         self.thread_id = thread_id
     
-    def _validate_base64_image(self, base64_string: str, max_size_mb: int = 10) -> tuple[bool, str]:
+    def _validate_base64_image(self, base64_string: str, max_size_mb: int = 10) -> tuple[bool, str, Optional[bytes], Optional[str]]:
         """
         Comprehensive validation of base64 image data.
         
+        The data is decoded exactly once; the decoded bytes and their MIME type
+        are returned so callers can upload them without decoding again.
+        
         Args:
             base64_string (str): The base64 encoded image data
             max_size_mb (int): Maximum allowed image size in megabytes
             
         Returns:
-            tuple[bool, str]: (is_valid, error_message)
+            tuple[bool, str, Optional[bytes], Optional[str]]: (is_valid, message, image_bytes, content_type)
         """
         try:
             # Check if data exists and has reasonable length
             if not base64_string or len(base64_string) < 10:
-                return False, "Base64 string is empty or too short"
+                return False, "Base64 string is empty or too short", None, None
             
             # Remove data URL prefix if present (data:image/jpeg;base64,...)
             if base64_string.startswith('data:'):
                 try:
                     base64_string = base64_string.split(',', 1)[1]
                 except (IndexError, ValueError):
-                    return False, "Invalid data URL format"
-            
-            # Check if string contains only valid base64 characters
-            # Base64 alphabet: A-Z, a-z, 0-9, +, /, = (padding)
-            import re
-            if not re.match(r'^[A-Za-z0-9+/]*={0,2}$', base64_string):
-                return False, "Invalid base64 characters detected"
+                    return False, "Invalid data URL format", None, None
             
             # Check if base64 string length is valid (must be multiple of 4)
             if len(base64_string) % 4 != 0:
-                return False, "Invalid base64 string length"
+                return False, "Invalid base64 string length", None, None
             
-            # Attempt to decode base64
+            # Decode base64; validate=True rejects characters outside the alphabet
             try:
                 image_data = base64.b64decode(base64_string, validate=True)
             except Exception as e:
-                return False, f"Base64 decoding failed: {str(e)}"
+                return False, f"Base64 decoding failed: {str(e)}", None, None
             
             # Check decoded data size
             if len(image_data) == 0:
-                return False, "Decoded image data is empty"
+                return False, "Decoded image data is empty", None, None
             
             # Check if decoded data size exceeds limit
             max_size_bytes = max_size_mb * 1024 * 1024
             if len(image_data) > max_size_bytes:
-                return False, f"Image size ({len(image_data)} bytes) exceeds limit ({max_size_bytes} bytes)"
+                return False, f"Image size ({len(image_data)} bytes) exceeds limit ({max_size_bytes} bytes)", None, None
             
             # Validate that decoded data is actually a valid image using PIL
             try:
@@ -96,15 +94,16 @@ class BrowserTool(SandboxToolsBase):
                     # Check if image format is supported
                     supported_formats = {'JPEG', 'PNG', 'GIF', 'BMP', 'WEBP', 'TIFF'}
                     if img.format not in supported_formats:
-                        return False, f"Unsupported image format: {img.format}"
+                        return False, f"Unsupported image format: {img.format}", None, None
                     
-                    return True, "Image validation successful"
+                    content_type = Image.MIME.get(img.format, "image/png")
+                    return True, "Image validation successful", image_data, content_type
                     
             except Exception as e:
-                return False, f"Image validation failed: {str(e)}"
+                return False, f"Image validation failed: {str(e)}", None, None
                 
         except Exception as e:
-            return False, f"Image validation error: {str(e)}"
+            return False, f"Image validation error: {str(e)}", None, None
     
     async def _debug_sandbox_services(self) -> str:
         """Debug method to check what services are running in the sandbox"""
@@ -251,28 +250,33 @@ class BrowserTool(SandboxToolsBase):
             if response.exit_code == 0:
                 try:
                     result = json.loads(response.result)
-                    logger.debug(f"Stagehand API result: {result}")
+                    logger.debug("Stagehand API result: %s", result)
 
                     logger.debug("Stagehand API request completed successfully")
 
                     if "screenshot_base64" in result:
                         try:
                             screenshot_data = result["screenshot_base64"]
-                            is_valid, validation_message = self._validate_base64_image(screenshot_data)
+                            is_valid, validation_message, image_bytes, content_type = self._validate_base64_image(screenshot_data)
                             
                             if is_valid:
-                                logger.debug(f"Screenshot validation passed: {validation_message}")
-                                image_url = await upload_base64_image(screenshot_data, "browser-screenshots")
+                                logger.debug("Screenshot validation passed: %s", validation_message)
+                                image_url = await upload_image_bytes(
+                                    image_bytes,
+                                    content_type,
+                                    "browser-screenshots",
+                                    filename_prefix="image",
+                                )
                                 result["image_url"] = image_url
-                                logger.debug(f"Uploaded screenshot to {image_url}")
+                                logger.debug("Uploaded screenshot to %s", image_url)
                             else:
-                                logger.warning(f"Screenshot validation failed: {validation_message}")
+                                logger.warning("Screenshot validation failed: %s", validation_message)
                                 result["image_validation_error"] = validation_message
                                 
                             del result["screenshot_base64"]
                             
                         except Exception as e:
-                            logger.error(f"Failed to process screenshot: {e}")
+                            logger.error("Failed to process screenshot: %s", e)
                             result["image_upload_error"] = str(e)
                     
                     result["input"] = params
@@ -316,7 +320,7 @@ class BrowserTool(SandboxToolsBase):
                         return self.fail_response(clean_result)
 
                 except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse response JSON: {response.result} {e}")
+                    logger.error("Failed to parse response JSON: %s %s", response.result, e)
                     return self.fail_response(f"Failed to parse response JSON: {response.result} {e}")
             else:
                 # Check if it's a connection error (exit code 7)
@@ -325,11 +329,11 @@ class BrowserTool(SandboxToolsBase):
                     logger.error(error_msg)
                     return self.fail_response(error_msg)
                 else:
-                    logger.error(f"Stagehand API request failed: {response}")
+                    logger.error("Stagehand API request failed: %s", response)
                     return self.fail_response(f"Stagehand API request failed: {response}")
 
         except Exception as e:
-            logger.error(f"Error executing Stagehand action: {e}")
+            logger.error("Error executing Stagehand action: %s", e)
             logger.debug(traceback.format_exc())
             return self.fail_response(f"Error executing Stagehand action: {e}")
 
@@ -354,7 +358,7 @@ class BrowserTool(SandboxToolsBase):
     })
     async def browser_navigate_to(self, url: str) -> ToolResult:
         """Navigate to a URL using Stagehand."""
-        logger.debug(f"Browser navigating to: {url}")
+        logger.debug("Browser navigating to: %s", url)
         return await self._execute_stagehand_api("navigate", {"url": url})
     
     @openapi_schema({
@@ -391,7 +395,7 @@ class BrowserTool(SandboxToolsBase):
     })
     async def browser_act(self, action: str, variables: dict = None, iframes: bool = False, filePath: dict = None) -> ToolResult:
         """Perform any browser action using Stagehand."""
-        logger.debug(f"Browser acting: {action} (variables={'***' if variables else None}, iframes={iframes}), filePath={filePath}")
+        logger.debug("Browser acting: %s (variables=%s, iframes=%s), filePath=%s", action, '***' if variables else None, iframes, filePath)
         params = {"action": action, "iframes": iframes, "variables": variables}
         if filePath:
             params["filePath"] = filePath
@@ -421,7 +425,7 @@ class BrowserTool(SandboxToolsBase):
     })
     async def browser_extract_content(self, instruction: str, iframes: bool = False) -> ToolResult:
         """Extract structured content from the current page using Stagehand."""
-        logger.debug(f"Browser extracting: {instruction} (iframes={iframes})")
+        logger.debug("Browser extracting: %s (iframes=%s)", instruction, iframes)
         params = {"instruction": instruction, "iframes": iframes}
         return await self._execute_stagehand_api("extract", params)
     
@@ -444,5 +448,5 @@ class BrowserTool(SandboxToolsBase):
     })
     async def browser_screenshot(self, name: str = "screenshot") -> ToolResult:
         """Take a screenshot using Stagehand."""
-        logger.debug(f"Browser taking screenshot: {name}")
+        logger.debug("Browser taking screenshot: %s", name)
         return await self._execute_stagehand_api("screenshot", {"name": name})
@@ -139,8 +139,22 @@ class SandboxPresentationTool(SandboxToolsBase):
         # Ensure presentation directory exists
         await self._ensure_presentation_dir(presentation_name)
         
-        # Use os.walk to recursively copy all files
+        # Use os.walk to recursively copy all files; uploads within a directory run concurrently
         copied_files = []
+        upload_semaphore = asyncio.Semaphore(8)
+
+        async def copy_file(source_file: str, rel_file_path: str, target_file: str) -> Optional[str]:
+            async with upload_semaphore:
+                try:
+                    with open(source_file, 'rb') as f:
+                        file_content = f.read()
+                    await self.sandbox.fs.upload_file(file_content, target_file)
+                    return rel_file_path
+                except Exception as e:
+                    # Log error but continue with other files
+                    logger.warning("Error copying %s: %s", rel_file_path, e)
+                    return None
+
         for root, dirs, files in os.walk(template_path):
             # Calculate relative path from template root
             rel_path = os.path.relpath(root, template_path)
@@ -157,19 +171,16 @@ class SandboxPresentationTool(SandboxToolsBase):
                 target_dir_path = presentation_path
             
             # Copy all files
+            copy_tasks = []
             for file in files:
                 source_file = os.path.join(root, file)
                 rel_file_path = os.path.relpath(source_file, template_path)
                 target_file = os.path.join(presentation_path, rel_file_path).replace('\\', '/')
-                
-                try:
-                    with open(source_file, 'rb') as f:
-                        file_content = f.read()
-                    await self.sandbox.fs.upload_file(file_content, target_file)
+                copy_tasks.append(copy_file(source_file, rel_file_path, target_file))
+            
+            for rel_file_path in await asyncio.gather(*copy_tasks):
+                if rel_file_path:
                     copied_files.append(rel_file_path)
-                except Exception as e:
-                    # Log error but continue with other files
-                    print(f"Error copying {rel_file_path}: {str(e)}")
         
         # Update metadata.json with correct paths for the new presentation
         metadata = await self._load_presentation_metadata(presentation_path)
@@ -21,9 +21,22 @@ from typing import Dict, Any, Optional, get_type_hints, Union
 from dotenv import load_dotenv
 import logging
 import secrets
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY_VALUES = ('true', 't', 'yes', 'y', '1')
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUTHY_VALUES
+
+
+@lru_cache(maxsize=None)
+def _get_config_type_hints(cls) -> Dict[str, Any]:
+    """Resolve (and cache) the annotated configuration fields of a class."""
+    return get_type_hints(cls)
+
 class SafeConfigWrapper:
     """
     A safe wrapper around the Configuration class that prevents NoneType AttributeErrors.
@@ -70,6 +83,8 @@ class EnvMode(Enum):
     STAGING = "staging"
     PRODUCTION = "production"
 
+_ENV_MODES: Dict[str, EnvMode] = {mode.value: mode for mode in EnvMode}
+
 class Configuration:
     """
     Centralized configuration for AgentPress backend.
@@ -328,6 +343,10 @@ class Configuration:
     # AWS Bedrock authentication
     AWS_BEARER_TOKEN_BEDROCK: Optional[str] = None
     
+    # AWS client HTTP pool (shared boto3 clients)
+    AWS_HTTP_MAX_POOL_CONNECTIONS: int = 50
+    AWS_HTTP_TCP_KEEPALIVE: bool = True
+    
     # Supabase configuration
     SUPABASE_URL: str
     SUPABASE_ANON_KEY: str
@@ -543,11 +562,11 @@ class Configuration:
         
         # Set environment mode first
         env_mode_str = os.getenv("ENV_MODE", EnvMode.LOCAL.value)
-        try:
-            self.ENV_MODE = EnvMode(env_mode_str.lower())
-        except ValueError:
+        env_mode = _ENV_MODES.get(env_mode_str.lower())
+        if env_mode is None:
             logger.warning(f"Invalid ENV_MODE: {env_mode_str}, defaulting to LOCAL")
-            self.ENV_MODE = EnvMode.LOCAL
+            env_mode = EnvMode.LOCAL
+        self.ENV_MODE = env_mode
             
         logger.debug(f"Environment mode: {self.ENV_MODE.value}")
         
@@ -564,18 +583,19 @@ class Configuration:
         
     def _load_from_env(self):
         """Load configuration values from environment variables."""
-        for key, expected_type in get_type_hints(self.__class__).items():
+        env = dict(os.environ)
+        for key, expected_type in _get_config_type_hints(self.__class__).items():
             # Skip ENV_MODE as it's already handled in __init__
             if key == "ENV_MODE":
                 continue
                 
-            env_val = os.getenv(key)
+            env_val = env.get(key)
             
             if env_val is not None:
                 # Convert environment variable to the expected type
                 if expected_type == bool:
                     # Handle boolean conversion
-                    setattr(self, key, env_val.lower() in ('true', 't', 'yes', 'y', '1'))
+                    setattr(self, key, _parse_bool(env_val))
                 elif expected_type == int:
                     # Handle integer conversion
                     try:
@@ -597,24 +617,24 @@ class Configuration:
                     setattr(self, key, None)
         
         # Custom handling for environment-dependent properties
-        max_parallel_runs_env = os.getenv("MAX_PARALLEL_AGENT_RUNS")
+        max_parallel_runs_env = env.get("MAX_PARALLEL_AGENT_RUNS")
         if max_parallel_runs_env is not None:
             self._MAX_PARALLEL_AGENT_RUNS_ENV = max_parallel_runs_env
         
         # Custom handling for frontend URL
-        frontend_url_env = os.getenv("FRONTEND_URL")
+        frontend_url_env = env.get("FRONTEND_URL")
         if frontend_url_env is not None:
             self.FRONTEND_URL_ENV = frontend_url_env
         
         # Custom handling for DEBUG_SAVE_LLM_IO (always False in production)
-        debug_save_llm_io_env = os.getenv("DEBUG_SAVE_LLM_IO")
+        debug_save_llm_io_env = env.get("DEBUG_SAVE_LLM_IO")
         if debug_save_llm_io_env is not None:
-            self._DEBUG_SAVE_LLM_IO = debug_save_llm_io_env.lower() in ('true', 't', 'yes', 'y', '1')
+            self._DEBUG_SAVE_LLM_IO = _parse_bool(debug_save_llm_io_env)
     
     def _validate(self):
         """Validate configuration based on type hints."""
         # Get all configuration fields and their type hints
-        type_hints = get_type_hints(self.__class__)
+        type_hints = _get_config_type_hints(self.__class__)
         
         # Find missing required fields
         missing_fields = []
@@ -639,7 +659,7 @@ class Configuration:
         """Return configuration as a dictionary."""
         return {
             key: getattr(self, key) 
-            for key in get_type_hints(self.__class__).keys()
+            for key in _get_config_type_hints(self.__class__).keys()
             if not key.startswith('_')
         }
 
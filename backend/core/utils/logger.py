@@ -1,4 +1,5 @@
-import structlog, logging, os
+import structlog, logging, os, sys
+import orjson
 
 ENV_MODE = os.getenv("ENV_MODE", "LOCAL")
 
@@ -9,6 +10,11 @@ else:
     default_level = "DEBUG" 
     # default_level = "INFO"
 
+# Keep test runs quiet unless LOGGING_LEVEL asks otherwise; filtered levels
+# become no-ops so tests don't pay for formatting and console rendering
+if "pytest" in sys.modules or os.getenv("PYTEST_CURRENT_TEST"):
+    default_level = "WARNING"
+
 LOGGING_LEVEL = logging.getLevelNamesMapping().get(
     os.getenv("LOGGING_LEVEL", default_level).upper(), 
     logging.DEBUG  
@@ -19,9 +25,12 @@ LOGGING_LEVEL = logging.getLevelNamesMapping().get(
 if ENV_MODE.lower() == "local".lower() or ENV_MODE.lower() == "staging".lower():
     exception_processor = structlog.processors.format_exc_info
     renderer = [structlog.dev.ConsoleRenderer(colors=True)]
+    logger_factory = structlog.PrintLoggerFactory()
 else:
     exception_processor = structlog.processors.dict_tracebacks
-    renderer = [structlog.processors.JSONRenderer()]
+    # orjson renders straight to bytes, so write them without a str round-trip
+    renderer = [structlog.processors.JSONRenderer(serializer=orjson.dumps, option=orjson.OPT_NON_STR_KEYS)]
+    logger_factory = structlog.BytesLoggerFactory()
 
 structlog.configure(
     processors=[
@@ -39,6 +48,7 @@ structlog.configure(
         structlog.contextvars.merge_contextvars,
         *renderer,
     ],
+    logger_factory=logger_factory,
     cache_logger_on_first_use=True,
     wrapper_class=structlog.make_filtering_bound_logger(LOGGING_LEVEL),
 )